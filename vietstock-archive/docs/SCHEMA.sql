@@ -59,6 +59,8 @@ CREATE TABLE IF NOT EXISTS articles (
 CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(fetch_status);
 CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at);
 CREATE INDEX IF NOT EXISTS idx_articles_discovered ON articles(discovered_at);
+CREATE INDEX IF NOT EXISTS idx_articles_pending_disc_url ON articles(discovered_at, url) WHERE fetch_status='pending';
+CREATE INDEX IF NOT EXISTS idx_articles_sha ON articles(content_sha256);
 
 -- Optional analysis tables (not required for initial ingestion)
 CREATE TABLE IF NOT EXISTS analysis (